@@ -1,5 +1,6 @@
 import json
 
+import pytest
 from attrs import asdict
 
 from thermite.plugins.default_defs import DefaultDefs, read_default_defs
@@ -30,3 +31,31 @@ def test_dict_default_defs(tmp_path):
     config_in = read_default_defs(config_file)
 
     assert config_in == dict(config_a=config_a, config_nested=config_nested)
+
+
+def test_default_defs_check():
+    config_nested.check()
+
+    with pytest.raises(ValueError):
+        DefaultDefs(opts=[["a", "b"]]).check()
+    with pytest.raises(ValueError):
+        DefaultDefs(opts=[["--a", "--b"]]).check()
+    with pytest.raises(ValueError):
+        DefaultDefs(cmds=dict(sub=DefaultDefs(opts=["a"]))).check()
+
+
+@pytest.mark.parametrize("suffix", [".json", ".yml"])
+def test_default_defs_extra_keys(tmp_path, suffix):
+    # json is valid yaml, so both formats can share the same content
+    config_file = tmp_path / f"config{suffix}"
+    config_file.write_text(json.dumps(dict(opts=[], cmds=dict(sub=dict(other=1)))))
+
+    with pytest.raises(Exception, match="Unknown keys other"):
+        read_default_defs(config_file)
+
+
+def test_default_defs_yaml(tmp_path):
+    config_file = tmp_path / "config.yml"
+    config_file.write_text(json.dumps(asdict(config_nested)))
+
+    assert read_default_defs(config_file) == config_nested
@@ -1,9 +1,94 @@
+import sys
 from pathlib import Path
-from typing import Union
+from typing import Dict, List, Literal, Union
 
-from thermite.plugins.help import clean_type_str
+import pytest
+from rich.console import Console
+
+from thermite.plugins.help import (
+    OptHelp,
+    ProcessorHelp,
+    clean_type_str,
+    opt_help_list_to_table,
+)
+from thermite.run import run, runner_testing
 
 
 def test_clean_type_str():
     assert clean_type_str(int) == "int"
     assert clean_type_str(Union[int, Path]) == "Union[int, Path]"
+    assert clean_type_str(Dict[str, List[Path]]) == "Dict[str, List[Path]]"
+
+
+def test_clean_type_str_equal_types():
+    # equal types with different reprs must not share a cached result
+    assert clean_type_str(Union[int, str]) == "Union[int, str]"
+    assert clean_type_str(Union[str, int]) == "Union[str, int]"
+    assert clean_type_str(Literal["a", "b"]) == "Literal['a', 'b']"
+    assert clean_type_str(Literal["b", "a"]) == "Literal['b', 'a']"
+
+
+def test_opt_table_no_markup():
+    # cells are rendered as Text, so brackets in types are not taken as markup
+    opt = OptHelp(
+        processors=[ProcessorHelp(triggers="--x", type_descr="List[bold]")],
+        default="[1]",
+        descr="",
+    )
+    console = Console(record=True, width=80)
+    console.print(opt_help_list_to_table([opt]))
+    output = console.export_text()
+    assert "List[bold]" in output
+    assert "[1]" in output
+
+
+class Nested:
+    """A nested class."""
+
+    def __init__(self, a: int):
+        self.a = a
+
+
+def func_with_nesting(b: str, nested: Nested):
+    """Function with a nested class."""
+    del b, nested
+
+
+def test_help_piped():
+    output = runner_testing(func_with_nesting, ["--help"])
+    assert output.exit_code == 0
+    assert "╭" not in output.stdout
+    assert "Options:" in output.stdout
+    assert "  nested:" in output.stdout
+    assert "    --nested-a  int" in output.stdout
+
+
+def test_help_forced_rich(monkeypatch):
+    monkeypatch.setenv("THERMITE_FORCE_RICH", "1")
+    output = runner_testing(func_with_nesting, ["--help"])
+    assert output.exit_code == 0
+    assert "╭" in output.stdout
+    assert "--nested-a" in output.stdout
+
+
+class _StreamWithoutIsatty:
+    def __init__(self):
+        self.written: List[str] = []
+
+    def write(self, text: str) -> int:
+        self.written.append(text)
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+@pytest.mark.parametrize("with_stream", [True, False])
+def test_help_stdout_without_isatty(monkeypatch, with_stream):
+    stream = _StreamWithoutIsatty() if with_stream else None
+    monkeypatch.setattr(sys, "stdout", stream)
+    with pytest.raises(SystemExit) as exc_info:
+        run(func_with_nesting, name="prog", input_args=["--help"])
+    assert exc_info.value.code == 0
+    if stream is not None:
+        assert "Options:" in "".join(stream.written)
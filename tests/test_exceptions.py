@@ -0,0 +1,10 @@
+import rich.traceback
+
+from thermite.exceptions import RichExcHandler
+
+
+def test_rich_exc_handler_defaults():
+    handler = RichExcHandler()
+    assert handler.locals_max_length == rich.traceback.LOCALS_MAX_LENGTH
+    assert handler.locals_max_string == rich.traceback.LOCALS_MAX_STRING
+    assert RichExcHandler(locals_max_length=3).locals_max_length == 3
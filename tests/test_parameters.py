@@ -1,6 +1,6 @@
 import inspect
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 import pytest
 from attrs import asdict, mutable
@@ -18,6 +18,7 @@ from thermite.parameters import (
     bool_option,
     process_class_to_param_group,
 )
+from thermite.parameters.processors import split_trigger_args
 from thermite.signatures import CliParamKind, ParameterSignature
 from thermite.type_converters import (
     BasicCLIArgConverter,
@@ -174,6 +175,54 @@ class TestBoolOption:
             opt.to_argument()
 
 
+def test_split_trigger_args():
+    num_args_cache: Dict[int, int] = {}
+    assert split_trigger_args(["--a", "1", "2"], 1, num_args_cache) == (
+        ["1"],
+        ["2"],
+    )
+    with pytest.raises(TooFewArgsError):
+        split_trigger_args(["--a"], 1, num_args_cache)
+    assert num_args_cache == {}
+
+    assert split_trigger_args(["--a", "1", "2"], slice(0, None), num_args_cache) == (
+        ["1", "2"],
+        [],
+    )
+    assert num_args_cache == {2: 2}
+
+
+class TestTriggerProcessor:
+    @pytest.fixture
+    def processor(self):
+        return ConvertTriggerProcessor(
+            triggers=["--a"],
+            res_type=int,
+            type_converter=BasicCLIArgConverter(int, int, int),
+        )
+
+    def test_check_trigger(self, processor):
+        assert processor.bind(["--a", "1", "2"]) == ["2"]
+        with pytest.raises(TriggerError):
+            processor.bind(["--b", "1"])
+        with pytest.raises(TriggerError):
+            processor.bind([])
+
+    def test_reassign_triggers(self, processor):
+        processor.triggers = ["--b"]
+        assert processor.triggers == ("--b",)
+        assert processor.bind(["--b", "1"]) == []
+        with pytest.raises(TriggerError):
+            processor.bind(["--a", "1"])
+
+    def test_reassign_converter_clears_cache(self, processor, store):
+        processor.type_converter = store.get_converter(List[int])
+        assert processor.bind(["--a", "1", "2"]) == []
+        assert processor._num_args_cache == {2: 2}
+        processor.type_converter = store.get_converter(List[str])
+        assert processor._num_args_cache == {}
+
+
 class TestOption:
     @pytest.mark.parametrize(
         "triggers,args,return_args, val_exp",
@@ -0,0 +1,81 @@
+import os
+import sys
+from types import ModuleType
+
+from thermite.command import Command
+from thermite.run import run, runner_testing
+
+from .examples import func_kw_or_pos
+
+
+def test_run_keeps_exception_handlers():
+    exception_handlers = []
+    output = runner_testing(
+        func_kw_or_pos, ["--a", "1"], exception_handlers=exception_handlers
+    )
+    assert output.exit_code == 0
+    assert exception_handlers == []
+
+
+def test_runner_testing_no_capture(capsys):
+    output = runner_testing(func_kw_or_pos, ["--help"], capture_stdout=False)
+    assert output.exit_code == 0
+    assert output.stdout == ""
+    assert "Usage:" in capsys.readouterr().out
+
+
+def test_run_reads_argv_at_call(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["prog", "--a", "3"])
+    assert run(func_kw_or_pos) == (3, "1")
+
+
+def test_run_command_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("THERMITE_CACHE", "1")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert run(func_kw_or_pos, input_args=["--a", "3"]) == (3, "1")
+    assert len(list((tmp_path / "thermite").glob("*.pkl"))) == 1
+    assert run(func_kw_or_pos, input_args=["--a", "4"]) == (4, "1")
+    assert len(list((tmp_path / "thermite").glob("*.pkl"))) == 1
+
+
+def test_run_command_cache_outdated(monkeypatch, tmp_path):
+    monkeypatch.setenv("THERMITE_CACHE", "1")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    # a loaded module the command could depend on
+    dep_file = tmp_path / "dep.py"
+    dep_file.write_text("")
+    dep_module = ModuleType("thermite_test_dep")
+    dep_module.__file__ = str(dep_file)
+    monkeypatch.setitem(sys.modules, "thermite_test_dep", dep_module)
+
+    num_created = []
+    from_obj = Command.from_obj
+
+    def counting_from_obj(*args, **kwargs):
+        num_created.append(1)
+        return from_obj(*args, **kwargs)
+
+    monkeypatch.setattr(Command, "from_obj", counting_from_obj)
+    assert run(func_kw_or_pos, input_args=["--a", "3"]) == (3, "1")
+    assert run(func_kw_or_pos, input_args=["--a", "3"]) == (3, "1")
+    assert len(num_created) == 1
+
+    os.utime(dep_file, ns=(0, 0))
+    assert run(func_kw_or_pos, input_args=["--a", "3"]) == (3, "1")
+    assert len(num_created) == 2
+
+
+def test_run_command_cache_pruned(monkeypatch, tmp_path):
+    monkeypatch.setenv("THERMITE_CACHE", "1")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    # thermite.run is shadowed by the run function in the package namespace
+    monkeypatch.setattr(sys.modules["thermite.run"], "_COMMAND_CACHE_MAX_ENTRIES", 1)
+    run(func_kw_or_pos, name="first", input_args=["--a", "3"])
+    run(func_kw_or_pos, name="second", input_args=["--a", "3"])
+    assert len(list((tmp_path / "thermite").glob("*.pkl"))) == 1
+
+
+def test_run_command_cache_tracked_files():
+    tracked = sys.modules["thermite.run"]._tracked_module_files(func_kw_or_pos)
+    assert sys.modules[func_kw_or_pos.__module__].__file__ in tracked
+    assert os.__file__ not in tracked
@@ -0,0 +1,45 @@
+from thermite.signatures import _cache_by_obj, process_function_to_obj_signature
+
+
+def func(a: int, b: str = "b"):
+    """Short description.
+
+    Args:
+        a: The a parameter.
+        b: The b parameter.
+    """
+    del a, b
+
+
+def test_cache_by_obj():
+    calls = []
+
+    def record(x):
+        calls.append(x)
+        return len(x)
+
+    record_cached = _cache_by_obj(record)
+    assert record_cached("ab") == 2
+    assert record_cached("ab") == 2
+    # unhashable inputs are not cached
+    assert record_cached(["a"]) == 1
+    assert record_cached(["a"]) == 1
+    assert calls == ["ab", ["a"], ["a"]]
+
+
+def test_function_sig_repeated():
+    sig1 = process_function_to_obj_signature(func)
+    sig2 = process_function_to_obj_signature(func)
+    assert sig1 == sig2
+    assert sig1.short_descr == "Short description."
+    assert sig1.params["a"].descr == "The a parameter."
+    assert sig1.params["b"].default_value == "b"
+
+
+def test_function_sig_changes_not_cached():
+    sig1 = process_function_to_obj_signature(func)
+    del sig1.params["a"]
+    sig1.params["b"].descr = "changed"
+    sig2 = process_function_to_obj_signature(func)
+    assert list(sig2.params.keys()) == ["a", "b"]
+    assert sig2.params["b"].descr == "The b parameter."
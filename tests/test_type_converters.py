@@ -1,10 +1,16 @@
 from enum import Enum
+from functools import partial
 from pathlib import Path
 from typing import Any, List, Literal, Tuple, Type, Union
 
 import pytest
 
-from thermite.type_converters import CLIArgConverterStore
+from thermite.type_converters import (
+    BasicCLIArgConverter,
+    CLIArgConverterStore,
+    TooFewArgsError,
+    args_used,
+)
 
 enum_test = Enum("test", ["a", "b", "2"])
 
@@ -22,6 +28,9 @@ args_tests = [  # type: ignore
     (bool, ["f"], False, 1),
     (bool, ["yes"], True, 1),
     (bool, ["no"], False, 1),
+    (bool, ["Y"], True, 1),
+    (bool, ["0"], False, 1),
+    (bool, ["maybe"], None, 1),
     (bool, ["a"], None, 1),
     (Path, ["a"], Path("a"), 1),
     (str, ["a"], "a", 1),
@@ -35,12 +44,29 @@ args_tests = [  # type: ignore
     (Union[enum_test, int], ["1"], 1, 1),
     (Union[enum_test, int], ["2"], enum_test["2"], 1),
     (Union[enum_test, int], ["1.1"], None, 1),
+    (Union[Literal["x"], enum_test, int], ["x"], "x", 1),
+    (Union[Literal["x"], enum_test, int], ["b"], enum_test.b, 1),
+    (Union[Literal["x"], enum_test, int], ["3"], 3, 1),
     (Tuple[int, str], ["2", "yes"], (2, "yes"), 2),
     (Tuple[int, str], ["a", "yes"], None, 2),
     (Tuple[int, str], ["a"], None, 2),
+    (Tuple[Tuple[int, int], str], ["1", "2", "a"], ((1, 2), "a"), 3),
+    (Tuple[bool, Literal["a", "b"]], ["yes", "b"], (True, "b"), 2),
+    (Tuple[bool, Literal["a", "b"]], ["yes", "c"], None, 2),
     (List[int], ["1", "2"], [1, 2], slice(0, None, 1)),
+    (List[str], ["1", "2"], ["1", "2"], slice(0, None, 1)),
+    (List[enum_test], ["a", "2"], [enum_test.a, enum_test["2"]], slice(0, None, 1)),
+    (List[enum_test], ["a", "c"], None, slice(0, None, 1)),
+    (List, ["1", "2"], ["1", "2"], slice(0, None, 1)),
     (List[int], [], [], slice(0, None, 1)),
     (List[int], ["a", "2"], None, slice(0, None, 1)),
+    (
+        List[Tuple[int, str]],
+        ["1", "a", "2", "b"],
+        [(1, "a"), (2, "b")],
+        slice(0, None, 2),
+    ),
+    (List[Tuple[int, str]], ["1", "a", "2"], None, slice(0, None, 2)),
 ]
 
 
@@ -60,3 +86,91 @@ def test_store(
     else:
         with pytest.raises(Exception):
             converter.convert(args)
+
+
+def test_store_cache(store: CLIArgConverterStore):
+    converter = store.get_converter(List[int])
+    assert store.get_converter(List[int]) is converter
+
+    store.add_converter_factory(
+        partial(
+            BasicCLIArgConverter.factory,
+            supported_type=int,
+            conv_func=lambda x: abs(int(x)),
+        ),
+        20,
+    )
+    new_converter = store.get_converter(List[int])
+    assert new_converter is not converter
+    assert new_converter.convert(["-1"]) == [1]
+
+
+def test_store_dispatch_key(store: CLIArgConverterStore):
+    calls = []
+
+    def int_factory(target_type, store):
+        calls.append(target_type)
+        return BasicCLIArgConverter.factory(target_type, store, supported_type=int)
+
+    store.add_converter_factory(int_factory, 20, int)
+    assert store.get_converter(str).convert(["1"]) == "1"
+    assert store.get_converter(int).convert(["1"]) == 1
+    assert calls == [int]
+
+
+def test_store_cache_union(store: CLIArgConverterStore):
+    converter = store.get_converter(int)
+    union_converter = store.get_converter(Union[int, str])
+    assert union_converter._converters[0] is converter
+
+
+def test_store_factory_order():
+    store = CLIArgConverterStore(add_defaults=False)
+    for name, priority in [("a", 1), ("b", 3), ("c", 2), ("d", 3)]:
+        store.add_converter_factory(name, priority)  # type: ignore
+    assert [x[0] for x in store._converter_factories] == ["b", "d", "c", "a"]
+
+
+@pytest.mark.parametrize(
+    "num_offered,num_req,expected",
+    [
+        (3, 2, 2),
+        (5, slice(0, None, 1), 5),
+        (5, slice(0, None, 2), 4),
+        (4, slice(1, 6, 2), 3),
+        (9, slice(1, 6, 2), 5),
+        (2, slice(2, None, 3), 2),
+    ],
+)
+def test_args_used(num_offered, num_req, expected):
+    assert args_used(num_offered, num_req) == expected
+
+
+@pytest.mark.parametrize("num_offered,num_req", [(1, 2), (1, slice(2, None, 1))])
+def test_args_used_too_few(num_offered, num_req):
+    with pytest.raises(TooFewArgsError):
+        args_used(num_offered, num_req)
+
+
+def test_can_convert(store: CLIArgConverterStore):
+    assert store.get_converter(bool).can_convert(["Yes"])
+    assert not store.get_converter(bool).can_convert(["maybe"])
+    assert store.get_converter(enum_test).can_convert(["a"])
+    assert not store.get_converter(enum_test).can_convert(["c"])
+    assert store.get_converter(Union[bool, enum_test]).convert(["a"]) == enum_test.a
+
+
+def test_store_candidates_by_key(store: CLIArgConverterStore):
+    assert len(store._candidate_factories(int)) == 1
+    assert len(store._candidate_factories(List[int])) == 1
+    assert len(store._candidate_factories(enum_test)) == 1
+
+
+@pytest.mark.parametrize("arg", ["1", " 2 ", "-3", "1_000", "abc", "1.5", "", "²"])
+def test_int_can_convert_no_false_negatives(store: CLIArgConverterStore, arg: str):
+    try:
+        int(arg)
+    except ValueError:
+        pass
+    else:
+        assert store.get_converter(int).can_convert([arg])
@@ -28,3 +28,24 @@ def test_analyze_class():
         "d": ClassContentType.property,
         "e": ClassContentType.classvar,
     }
+
+
+class B(A):
+    e = 1
+
+    def g(self):
+        pass
+
+
+def test_analyze_class_inherited():
+    res = analyze_class(B)
+    assert res["a"] == ClassContentType.staticmethod
+    assert res["d"] == ClassContentType.property
+    assert res["e"] == ClassContentType.classvar
+    assert res["g"] == ClassContentType.instancemethod
+    assert "__init__" in analyze_class(B, omit_dunder=False)
+
+
+def test_class_content_type_str():
+    assert ClassContentType.classmethod == "classmethod"
+    assert {"property": 1}[ClassContentType.property] == 1
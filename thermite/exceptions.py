@@ -3,8 +3,7 @@ import traceback
 from types import ModuleType
 from typing import Iterable, Optional, Union
 
-import rich.traceback as rtb
-from attrs import asdict, mutable
+from attrs import asdict, field, mutable
 from exceptiongroup import ExceptionGroup
 
 from thermite.rich import console
@@ -101,6 +100,19 @@ class ThermiteExcHandler:
             return exc
 
 
+# rich.traceback is slow to import, so its defaults are only looked up when needed
+def _rich_locals_max_length() -> int:
+    import rich.traceback as rtb
+
+    return rtb.LOCALS_MAX_LENGTH
+
+
+def _rich_locals_max_string() -> int:
+    import rich.traceback as rtb
+
+    return rtb.LOCALS_MAX_STRING
+
+
 @mutable
 class RichExcHandler:
     width: Optional[int] = 100
@@ -108,8 +120,8 @@ class RichExcHandler:
     theme: Optional[str] = None
     word_wrap: bool = False
     show_locals: bool = True
-    locals_max_length: int = rtb.LOCALS_MAX_LENGTH
-    locals_max_string: int = rtb.LOCALS_MAX_STRING
+    locals_max_length: int = field(factory=_rich_locals_max_length)
+    locals_max_string: int = field(factory=_rich_locals_max_string)
     locals_hide_dunder: bool = True
     locals_hide_sunder: bool = False
     indent_guides: bool = True
@@ -117,6 +129,8 @@ class RichExcHandler:
     max_frames: int = 100
 
     def __call__(self, exc: Exception) -> Optional[Exception]:
+        import rich.traceback as rtb
+
         trace = rtb.Traceback.from_exception(
             type(exc), exc, exc.__traceback__, **asdict(self)
         )
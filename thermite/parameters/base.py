@@ -47,11 +47,11 @@ class Parameter(ABC, ParameterSignature):
 
     @property
     def unset(self) -> bool:
-        return self._value == ... and len(self._exceptions) == 0
+        return self._value is ... and len(self._exceptions) == 0
 
     @property
     def is_required(self) -> bool:
-        return self.default_value == ...
+        return self.default_value is ...
 
     @property
     def value(self) -> Any:
@@ -63,11 +63,11 @@ class Parameter(ABC, ParameterSignature):
                     f"Multiple errors in {self.name}",
                     self._exceptions,
                 )
-        elif self._value != ...:
+        elif self._value is not ...:
             return self._value
         else:
             # unset
-            if self.default_value == ...:
+            if self.default_value is ...:
                 raise ParameterError(
                     f"Paramter {self.name} was not specified and has no default"
                 )
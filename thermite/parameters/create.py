@@ -34,101 +34,125 @@ from .processors import (
 )
 
 
-def process_parameter(
-    param_sig: ParameterSignature, prefix: str, config: Config
+def _process_var_positional(
+    param_sig: ParameterSignature, base_trigger_name: str, config: Config
 ) -> Union[Parameter, ParameterGroup]:
-    """
-    Process a python parameter into a thermite parameter
-    """
-    # find the right type converter
-    # if no type annotations, it is assumed it is str
-    store = config.cli_args_store
-    res: Union[Parameter, ParameterGroup]
-    base_trigger_name = (
-        clify_argname(f"{prefix}-{param_sig.name}")
-        if prefix != ""
-        else clify_argname(param_sig.name)
+    # argument list
+    # the converter needs to be changed; the type annotation is per item,
+    # not for the whole list
+    annot_to_use = List[param_sig.annot]  # type: ignore
+    conv = config.cli_args_store.get_converter(annot_to_use)
+    return Option(
+        **asdict(param_sig),
+        processors=[
+            MultiConvertTriggerProcessor(
+                triggers=[f"--{base_trigger_name}"],
+                type_converter=conv,
+                res_type=annot_to_use,
+            )
+        ],
     )
 
-    if param_sig.python_kind == inspect.Parameter.VAR_POSITIONAL:
-        # argument list
-        # the converter needs to be changed; the type annotation is per item,
-        # not for the whole list
-        annot_to_use = List[param_sig.annot]  # type: ignore
-        conv = store.get_converter(annot_to_use)
+
+def _process_positional_or_keyword(
+    param_sig: ParameterSignature, base_trigger_name: str, config: Config
+) -> Union[Parameter, ParameterGroup]:
+    store = config.cli_args_store
+    res: Union[Parameter, ParameterGroup]
+    if param_sig.annot == bool:
+        # need to use a bool-option
+        res = bool_option(
+            param_sig=param_sig,
+            pos_triggers=[f"--{base_trigger_name}"],
+            neg_triggers=[f"--no-{base_trigger_name}"],
+        )
+    elif get_origin(param_sig.annot) in (List, list, Sequence):
+        annot_args = get_args(param_sig.annot)
+        if len(annot_args) == 0:
+            inner_type = str
+        elif len(annot_args) == 1:
+            inner_type = annot_args[0]
+        else:
+            raise TypeError(f"{str(param_sig.annot)} has more than 1 argument.")
+        conv = store.get_converter(inner_type)
         res = Option(
             **asdict(param_sig),
             processors=[
                 MultiConvertTriggerProcessor(
                     triggers=[f"--{base_trigger_name}"],
                     type_converter=conv,
-                    res_type=annot_to_use,
+                    res_type=param_sig.annot,
                 )
             ],
         )
-    elif param_sig.python_kind in (
-        inspect.Parameter.POSITIONAL_OR_KEYWORD,
-        inspect.Parameter.KEYWORD_ONLY,
-        inspect.Parameter.POSITIONAL_ONLY,
-    ):
-        if param_sig.annot == bool:
-            # need to use a bool-option
-            res = bool_option(
-                param_sig=param_sig,
-                pos_triggers=[f"--{base_trigger_name}"],
-                neg_triggers=[f"--no-{base_trigger_name}"],
-            )
-        elif get_origin(param_sig.annot) in (List, list, Sequence):
-            annot_args = get_args(param_sig.annot)
-            if len(annot_args) == 0:
-                inner_type = str
-            elif len(annot_args) == 1:
-                inner_type = annot_args[0]
-            else:
-                raise TypeError(f"{str(param_sig.annot)} has more than 1 argument.")
-            conv = store.get_converter(inner_type)
+    else:
+        try:
+            conv = store.get_converter(param_sig.annot)
             res = Option(
                 **asdict(param_sig),
                 processors=[
-                    MultiConvertTriggerProcessor(
+                    ConvertTriggerProcessor(
                         triggers=[f"--{base_trigger_name}"],
                         type_converter=conv,
                         res_type=param_sig.annot,
+                        allow_replace=False,
                     )
                 ],
             )
-        else:
-            try:
-                conv = store.get_converter(param_sig.annot)
-                res = Option(
-                    **asdict(param_sig),
-                    processors=[
-                        ConvertTriggerProcessor(
-                            triggers=[f"--{base_trigger_name}"],
-                            type_converter=conv,
-                            res_type=param_sig.annot,
-                            allow_replace=False,
-                        )
-                    ],
+        except TypeError:
+            # see if this could be done using a class option group
+            if inspect.isclass(param_sig.annot):
+                res = process_class_to_param_group(
+                    klass=param_sig.annot,
+                    python_kind=param_sig.python_kind,
+                    config=config,
+                    name=param_sig.name,
+                    prefix=base_trigger_name,
                 )
-            except TypeError:
-                # see if this could be done using a class option group
-                if inspect.isclass(param_sig.annot):
-                    res = process_class_to_param_group(
-                        klass=param_sig.annot,
-                        python_kind=param_sig.python_kind,
-                        config=config,
-                        name=param_sig.name,
-                        prefix=base_trigger_name,
-                    )
-                    res.default_value = param_sig.default_value
-                else:
-                    raise
-    elif param_sig.python_kind == inspect.Parameter.VAR_KEYWORD:
-        # not yet a solution; should allow to pass any option
-        raise NotImplementedError("VAR_KEYWORDS not yet supported")
-    else:
+                res.default_value = param_sig.default_value
+            else:
+                raise
+    return res
+
+
+def _process_var_keyword(
+    param_sig: ParameterSignature, base_trigger_name: str, config: Config
+) -> Union[Parameter, ParameterGroup]:
+    del param_sig, base_trigger_name, config
+    # not yet a solution; should allow to pass any option
+    raise NotImplementedError("VAR_KEYWORDS not yet supported")
+
+
+_PARAM_KIND_PROCESSORS: Dict[
+    inspect._ParameterKind,
+    Callable[[ParameterSignature, str, Config], Union[Parameter, ParameterGroup]],
+] = {
+    inspect.Parameter.VAR_POSITIONAL: _process_var_positional,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD: _process_positional_or_keyword,
+    inspect.Parameter.KEYWORD_ONLY: _process_positional_or_keyword,
+    inspect.Parameter.POSITIONAL_ONLY: _process_positional_or_keyword,
+    inspect.Parameter.VAR_KEYWORD: _process_var_keyword,
+}
+
+
+def process_parameter(
+    param_sig: ParameterSignature, prefix: str, config: Config
+) -> Union[Parameter, ParameterGroup]:
+    """
+    Process a python parameter into a thermite parameter
+    """
+    # find the right type converter
+    # if no type annotations, it is assumed it is str
+    base_trigger_name = (
+        clify_argname(f"{prefix}-{param_sig.name}")
+        if prefix != ""
+        else clify_argname(param_sig.name)
+    )
+
+    kind_processor = _PARAM_KIND_PROCESSORS.get(param_sig.python_kind)
+    if kind_processor is None:
         raise Exception(f"Unknown value for kind: {param_sig.python_kind}")
+    res = kind_processor(param_sig, base_trigger_name, config)
 
     if param_sig.cli_kind == CliParamKind.ARGUMENT:
         if isinstance(res, Option):
@@ -19,6 +19,10 @@ from .base import Argument, Option, Parameter
 
 EllipsisType = type(...)
 
+_KEYWORD_KINDS = frozenset(
+    (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+)
+
 
 @mutable(kw_only=True)
 class ParameterGroup(MutableMapping):
@@ -118,12 +122,7 @@ class ParameterGroup(MutableMapping):
 
     @property
     def kwargs(self) -> Dict[str, Union[Parameter, "ParameterGroup"]]:
-        return {
-            k: p
-            for k, p in self.items()
-            if p.python_kind
-            in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
-        }
+        return {k: p for k, p in self.items() if p.python_kind in _KEYWORD_KINDS}
 
     def process(self, input_args: Sequence[str]) -> Sequence[str]:
         if len(input_args) == 0:
@@ -199,12 +198,12 @@ class ParameterGroup(MutableMapping):
 
     @property
     def is_required(self) -> bool:
-        return self.default_value == ... and self._num_params() > 0
+        return self.default_value is ... and self._num_params() > 0
 
     @property
     def value(self) -> Any:
         try:
-            if self._num_params() == 0 or not self.unset or self.default_value == ...:
+            if self._num_params() == 0 or not self.unset or self.default_value is ...:
                 return self._exec_obj()
             else:
                 return self.default_value
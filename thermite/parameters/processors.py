@@ -1,24 +1,88 @@
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, List, Sequence, Type
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
-from attrs import field, mutable
+from attrs import field, mutable, setters
 
 from thermite.exceptions import TriggerError
 from thermite.type_converters import (
     CLIArgConverterBase,
     ListCLIArgConverter,
-    split_args_by_nargs,
+    TooFewArgsError,
+    args_used,
 )
 
 
-def str_list_conv(x: Sequence[str]) -> List[str]:
-    return list(x)
+def str_tuple_conv(x: Sequence[str]) -> Tuple[str, ...]:
+    return tuple([sys.intern(trigger) for trigger in x])
+
+
+def split_trigger_args(
+    args: Sequence[str],
+    num_req_args: Union[int, slice],
+    num_args_cache: Dict[int, int],
+) -> Tuple[Sequence[str], Sequence[str]]:
+    """Split the arguments after the trigger into bound and remaining ones."""
+    if isinstance(num_req_args, int):
+        # constant number of arguments; no need to go through args_used
+        if len(args) <= num_req_args:
+            raise TooFewArgsError(
+                f"Required {num_req_args} but was offered {len(args) - 1}"
+            )
+        num_args_use = num_req_args
+    else:
+        num_offered = len(args) - 1
+        cached = num_args_cache.get(num_offered)
+        if cached is not None:
+            num_args_use = cached
+        else:
+            num_args_use = args_used(num_offered=num_offered, num_req=num_req_args)
+            num_args_cache[num_offered] = num_args_use
+
+    return (args[1 : (1 + num_args_use)], args[(1 + num_args_use) :])
+
+
+def _clear_num_args_cache(instance: "TriggerProcessor", attribute: Any, value: Any):
+    del attribute
+    instance._num_args_cache = {}
+    return value
+
+
+def _update_trigger_set(instance: "TriggerProcessor", attribute: Any, value: Any):
+    del attribute
+    instance._trigger_set = frozenset(value)
+    return value
 
 
 @mutable(kw_only=True)
 class TriggerProcessor(ABC):
-    triggers: List[str] = field(converter=str_list_conv)
+    # a tuple, so the triggers can only be changed by re-assigning them as a
+    # whole, which keeps the trigger set in sync
+    triggers: Tuple[str, ...] = field(
+        converter=str_tuple_conv,
+        on_setattr=setters.pipe(setters.convert, _update_trigger_set),
+    )
     res_type: Type
+    _trigger_set: FrozenSet[str] = field(init=False, repr=False, eq=False)
+
+    @_trigger_set.default
+    def _trigger_set_default(self) -> FrozenSet[str]:
+        return frozenset(self.triggers)
+
+    def _check_trigger(self, args: Sequence[str]) -> None:
+        if len(args) == 0:
+            raise TriggerError("A trigger is expected.")
+        if args[0] not in self._trigger_set:
+            raise TriggerError(f"Trigger {args[0]} not an allowed trigger.")
 
     @abstractmethod
     def bind(self, args: Sequence[str]) -> Sequence[str]:
@@ -34,10 +98,7 @@ class ConstantTriggerProcessor(TriggerProcessor):
     constant: Any
 
     def bind(self, args: Sequence[str]) -> Sequence[str]:
-        if len(args) == 0:
-            raise TriggerError("A trigger is expected.")
-        if args[0] not in self.triggers:
-            raise TriggerError(f"Trigger {args[0]} not an allowed trigger.")
+        self._check_trigger(args)
         return args[1:]
 
     def process(self, value: Any) -> Any:
@@ -47,45 +108,39 @@ class ConstantTriggerProcessor(TriggerProcessor):
 
 @mutable(kw_only=True)
 class ConvertTriggerProcessor(TriggerProcessor):
-    type_converter: CLIArgConverterBase
+    type_converter: CLIArgConverterBase = field(on_setattr=_clear_num_args_cache)
     bound_args: Sequence[str] = field(factory=list, init=False)
+    _num_args_cache: Dict[int, int] = field(
+        factory=dict, init=False, repr=False, eq=False
+    )
     allow_replace: bool = False
 
     def bind(self, args: Sequence[str]) -> Sequence[str]:
-        if len(args) == 0:
-            raise TriggerError("A trigger is expected.")
-        if args[0] not in self.triggers:
-            raise TriggerError(f"Trigger {args[0]} not an allowed trigger.")
-
-        bound_args, ret_args = split_args_by_nargs(
-            args[1:], num_req_args=self.type_converter.num_req_args
+        self._check_trigger(args)
+        self.bound_args, ret_args = split_trigger_args(
+            args, self.type_converter.num_req_args, self._num_args_cache
         )
-
-        self.bound_args = bound_args
         return ret_args
 
     def process(self, value: Any) -> Any:
-        if value != ... and not self.allow_replace:
+        if value is not ... and not self.allow_replace:
             raise TriggerError("Trigger already used once.")
         return self.type_converter.convert(self.bound_args)
 
 
 @mutable(kw_only=True)
 class MultiConvertTriggerProcessor(TriggerProcessor):
-    type_converter: CLIArgConverterBase
+    type_converter: CLIArgConverterBase = field(on_setattr=_clear_num_args_cache)
     bound_args: Sequence[str] = field(factory=list, init=False)
+    _num_args_cache: Dict[int, int] = field(
+        factory=dict, init=False, repr=False, eq=False
+    )
 
     def bind(self, args: Sequence[str]) -> Sequence[str]:
-        if len(args) == 0:
-            raise TriggerError("A trigger is expected.")
-        if args[0] not in self.triggers:
-            raise TriggerError(f"Trigger {args[0]} not an allowed trigger.")
-
-        bound_args, ret_args = split_args_by_nargs(
-            args[1:], num_req_args=self.type_converter.num_req_args
+        self._check_trigger(args)
+        self.bound_args, ret_args = split_trigger_args(
+            args, self.type_converter.num_req_args, self._num_args_cache
         )
-
-        self.bound_args = bound_args
         return ret_args
 
     def process(self, value: Any) -> Any:
@@ -11,6 +11,8 @@ from thermite.command import CliCallback, Command
 from thermite.config import EventCallback
 from thermite.parameters import Argument, ParameterGroup
 
+_DEFAULTDEFS_KEYS = frozenset(("args", "opts", "cmds"))
+
 
 def make_list_of_str(x: Union[str, List[str]]) -> List[str]:
     if isinstance(x, str):
@@ -29,89 +31,74 @@ class DefaultDefs:
 
     def check(self):
         for opt in self.opts:
-            opt = make_list_of_str(opt)
-            assert opt[0].startswith("-")
-            assert not any(x.startswith("-") for x in opt[1:])
+            if isinstance(opt, str):
+                opt = [opt]
+            if opt[0][:1] != "-":
+                raise ValueError(f"Option {opt} has to start with a trigger.")
+            for x in opt[1:]:
+                if x[:1] == "-":
+                    raise ValueError(
+                        f"Option {opt} can only have a trigger as first element."
+                    )
 
         for cmd in self.cmds.values():
             cmd.check()
 
 
-@mutable
-class DefaultDefsConverter:
-    """Converter using CAttrs to read PresetConfig from json/yaml."""
-
-    converter: Any
-
-    def __attrs_post_init__(self):
-        self.converter.register_structure_hook(DefaultDefs, self.structure_defs)
-        self.converter.register_structure_hook(
-            Union[Dict[str, DefaultDefs], DefaultDefs], self.structure_defs_union
-        )
-
-    def structure_defs(self, val, obj_type):
-        del obj_type
-        if "cmds" in val and val["cmds"] is not None:
-            for key in val["cmds"]:
-                val["cmds"][key] = self.converter.structure(
-                    val["cmds"][key], DefaultDefs
-                )
-
-        return DefaultDefs(**val)
-
-    # we register an unstructuring hook for more complex type
-    def structure_defs_union(self, val, obj_type):
-        del obj_type
-        if isinstance(val, dict):
-            if set(val.keys()).issubset(set(["args", "opts", "cmds"])):
-                # likely DefaultDefs
-                return self.converter.structure(val, DefaultDefs)
-            else:
-                return self.converter.structure(val, Dict[str, DefaultDefs])
-        else:
-            raise Exception("Can only structure dicts")
-
-    def structure(self, val, klass):
-        return self.converter.structure(val, klass)
+def _structure_defs(val: Any) -> DefaultDefs:
+    """Structure DefaultDefs from the plain data read from json or yaml."""
+    if not isinstance(val, dict):
+        raise Exception("Can only structure dicts")
+    extra_keys = val.keys() - _DEFAULTDEFS_KEYS
+    if len(extra_keys) > 0:
+        raise Exception(f"Unknown keys {', '.join(extra_keys)} in default definitions")
+
+    cmds = val.get("cmds")
+    return DefaultDefs(
+        opts=val.get("opts") or [],
+        args=val.get("args") or {},
+        cmds={k: _structure_defs(v) for k, v in cmds.items()} if cmds else {},
+    )
+
+
+def _structure_defs_union(val: Any) -> Union[DefaultDefs, Dict[str, DefaultDefs]]:
+    if not isinstance(val, dict):
+        raise Exception("Can only structure dicts")
+    if all(k in _DEFAULTDEFS_KEYS for k in val):
+        # likely DefaultDefs
+        return _structure_defs(val)
+    else:
+        return {k: _structure_defs(v) for k, v in val.items()}
 
 
 def read_default_defs(file: Path) -> Union[DefaultDefs, Dict[str, DefaultDefs]]:
     if file.suffix.lower() in [".json"]:
-        import cattrs.preconf.json as cjson
+        try:
+            import orjson
 
-        json_converter = DefaultDefsConverter(
-            cjson.make_converter(forbid_extra_keys=True)
-        )
-        default_defs = json_converter.structure(
-            json.loads(file.read_text()), Union[Dict[str, DefaultDefs], DefaultDefs]
-        )
-        return default_defs
+            data = orjson.loads(file.read_bytes())
+        except ImportError:
+            data = json.loads(file.read_text())
+        return _structure_defs_union(data)
     if file.suffix.lower() in [".yaml", ".yml"]:
-        import cattrs.preconf.pyyaml as cpyyaml
-
-        yaml_converter = DefaultDefsConverter(
-            cpyyaml.make_converter(forbid_extra_keys=True)
-        )
         try:
             import yaml as pyyaml
 
+            # the C loader is only available if pyyaml was built against libyaml
+            loader = getattr(pyyaml, "CSafeLoader", pyyaml.SafeLoader)
             with file.open("rb") as f:
-                default_defs = yaml_converter.structure(
-                    pyyaml.safe_load(f), Union[Dict[str, DefaultDefs], DefaultDefs]
-                )
-            return default_defs
+                data = pyyaml.load(f, Loader=loader)
+            return _structure_defs_union(data)
         except ImportError:
             pass
         try:
             from ruamel.yaml import YAML
 
-            yaml = YAML(typ="safe")
+            yaml = YAML(typ="safe", pure=False)
 
             with file.open("rb") as f:
-                default_defs = yaml_converter.structure(
-                    yaml.load(f), Union[Dict[str, DefaultDefs], DefaultDefs]
-                )
-            return default_defs
+                data = yaml.load(f)
+            return _structure_defs_union(data)
         except ImportError:
             pass
 
@@ -200,9 +187,9 @@ class ApplyDefaultsCommandCallback(EventCallback):
 
 def read_default_defs_cb_func(cmd: Command, default_defs_path_str: str):
     # retrieve the default definitions we should use
-    path_split = default_defs_path_str.split("#", maxsplit=1)
-    if len(path_split) == 1:
-        default_defs_path = Path(default_defs_path_str)
+    path_str, sep, subdefs_name = default_defs_path_str.partition("#")
+    if not sep:
+        default_defs_path = Path(path_str)
         default_defs = read_default_defs(default_defs_path)
         if not isinstance(default_defs, DefaultDefs):
             raise Exception(
@@ -211,8 +198,7 @@ def read_default_defs_cb_func(cmd: Command, default_defs_path_str: str):
                 f"{', '.join(default_defs.keys())}."
             )
     else:
-        default_defs_path = Path(path_split[0])
-        subdefs_name = path_split[1]
+        default_defs_path = Path(path_str)
         default_defs = read_default_defs(default_defs_path)
         if isinstance(default_defs, dict) and subdefs_name in default_defs:
             default_defs = default_defs[subdefs_name]
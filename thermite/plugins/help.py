@@ -1,6 +1,8 @@
 import inspect
+import os
 import re
 import sys
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union, _type_repr, get_args
 
 from attrs import field, mutable
@@ -34,16 +36,20 @@ class HelpEventCallback(EventCallback):
         return opt_grp_help
 
 
-def clean_type_str(obj) -> str:
-    type_descr = _type_repr(obj)
+# matches a name together with all its dotted module prefixes
+_MODULE_PREFIX_RE = re.compile(r"(?:[A-Za-z_][A-Za-z0-9_]*\.)+([A-Za-z_][A-Za-z0-9_]*)")
 
-    # clean out all modulenames
-    p = re.compile(r"([a-zA-Z0-9_]+\.)([a-zA-Z0-9_]+)")
-    num_repl = 1
-    while num_repl > 0:
-        type_descr, num_repl = p.subn(r"\2", type_descr)
 
-    return type_descr
+# keyed on the repr, as equal types (e.g. Union[int, str] and Union[str, int])
+# can have different reprs
+@lru_cache(maxsize=512)
+def _strip_module_prefixes(type_repr: str) -> str:
+    return _MODULE_PREFIX_RE.sub(r"\1", type_repr)
+
+
+def clean_type_str(obj) -> str:
+    # clean out all modulenames
+    return _strip_module_prefixes(_type_repr(obj))
 
 
 @mutable()
@@ -72,7 +78,7 @@ class OptHelp:
 
 
 def option_to_help(opt: Option) -> OptHelp:
-    default_str = str(opt.default_value) if opt.default_value != ... else ""
+    default_str = str(opt.default_value) if opt.default_value is not ... else ""
 
     return OptHelp(
         processors=[processor_to_processor_help(x) for x in opt.processors],
@@ -90,7 +96,7 @@ class ArgHelp:
 
 
 def argument_to_help(arg: Argument) -> ArgHelp:
-    default_str = str(arg.default_value) if arg.default_value != ... else ""
+    default_str = str(arg.default_value) if arg.default_value is not ... else ""
     return ArgHelp(
         name=arg.name,
         type_descr=clean_type_str(arg.res_type),
@@ -230,17 +236,17 @@ class OptionGroupHelp:
 def param_group_to_help_opts_only(
     pg: ParameterGroup, config: Config
 ) -> OptionGroupHelp:
-    cli_opts_single = [x for x in pg.cli_opts.values() if isinstance(x, Option)]
-    cli_opts_group = [x for x in pg.cli_pgs.values() if isinstance(x, ParameterGroup)]
-
-    opt_groups_help = [
-        param_group_to_help_opts_only(x, config=config) for x in cli_opts_group
-    ]
+    # cli_opts and cli_pgs are already filtered by type
+    opt_groups_help = []
+    for x in pg.cli_pgs.values():
+        x_help = param_group_to_help_opts_only(x, config=config)
+        if not x_help.empty:
+            opt_groups_help.append(x_help)
     opt_grp_help = OptionGroupHelp(
         name=pg.name,
         descr=pg.short_descr,
-        gen_opts=[option_to_help(x) for x in cli_opts_single],
-        opt_groups=[x for x in opt_groups_help if not x.empty],
+        gen_opts=[option_to_help(x) for x in pg.cli_opts.values()],
+        opt_groups=opt_groups_help,
     )
     for cb in config.event_callbacks:
         if isinstance(cb, HelpEventCallback):
@@ -289,7 +295,7 @@ class CommandHelp:
         elements.append(Text("Usage: " + self.usage + "\n"))
 
         if self.long_descr is not None:
-            elements.append(Text(inspect.cleandoc(self.long_descr) + "\n"))
+            elements.append(Text(self.long_descr + "\n"))
 
         cb_table = cb_help_list_to_table(self.callbacks)
         if cb_table is not None:
@@ -322,9 +328,11 @@ def command_to_help(cmd: Command) -> CommandHelp:
     # last we need the subcommands and their descriptions
     subcommands = {key: obj.descr for key, obj in cmd.subcommands.items()}
 
+    long_descr = cmd.param_group.long_descr
     cmd_help = CommandHelp(
         short_descr=cmd.param_group.short_descr,
-        long_descr=cmd.param_group.long_descr,
+        # cleaned once here instead of every time the help is rendered
+        long_descr=inspect.cleandoc(long_descr) if long_descr is not None else None,
         usage=cmd.usage,
         args=args,
         callbacks=cbs,
@@ -337,9 +345,95 @@ def command_to_help(cmd: Command) -> CommandHelp:
     return cmd_help
 
 
+def _text_rows(rows: List[List[str]], indent: str) -> List[str]:
+    """Align the rows of a table in columns."""
+    if len(rows) == 0:
+        return []
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    # columns that are empty throughout are left out
+    return [
+        (indent + "  ".join(x.ljust(w) for x, w in zip(row, widths) if w > 0)).rstrip()
+        for row in rows
+    ]
+
+
+def _opt_group_help_to_lines(opt_group: OptionGroupHelp, indent: str) -> List[str]:
+    lines = []
+    if opt_group.descr is not None:
+        lines.append(indent + opt_group.descr)
+    rows = []
+    for opt in opt_group.gen_opts:
+        for i, processor in enumerate(opt.processors):
+            rows.append(
+                [
+                    processor.triggers,
+                    processor.type_descr,
+                    opt.default if i == 0 else "",
+                    opt.descr if i == 0 else "",
+                ]
+            )
+    lines.extend(_text_rows(rows, indent=indent))
+    for grp in opt_group.opt_groups:
+        lines.append(f"{indent}{grp.name}:")
+        lines.extend(_opt_group_help_to_lines(grp, indent=indent + "  "))
+    return lines
+
+
+def command_help_to_text(cmd_help: CommandHelp) -> str:
+    """Plain text version of the help, without any rich formatting."""
+    lines = []
+    if cmd_help.short_descr is not None:
+        lines.extend([cmd_help.short_descr, ""])
+    lines.extend(["Usage: " + cmd_help.usage, ""])
+    if cmd_help.long_descr is not None:
+        lines.extend([cmd_help.long_descr, ""])
+
+    if len(cmd_help.callbacks) > 0:
+        lines.append("Eager Callbacks:")
+        lines.extend(
+            _text_rows([[cb.triggers, cb.descr] for cb in cmd_help.callbacks], "  ")
+        )
+        lines.append("")
+    if len(cmd_help.args) > 0:
+        lines.append("Arguments:")
+        lines.extend(
+            _text_rows(
+                [[x.name, x.type_descr, x.default, x.descr] for x in cmd_help.args],
+                "  ",
+            )
+        )
+        lines.append("")
+    if not cmd_help.opt_group.empty:
+        lines.append(f"{cmd_help.opt_group.name}:")
+        lines.extend(_opt_group_help_to_lines(cmd_help.opt_group, indent="  "))
+        lines.append("")
+    if len(cmd_help.subcommands) > 0:
+        lines.append("Commands:")
+        lines.extend(
+            _text_rows(
+                [
+                    [name, descr if descr is not None else ""]
+                    for name, descr in cmd_help.subcommands.items()
+                ],
+                "  ",
+            )
+        )
+        lines.append("")
+
+    return "\n".join(lines)
+
+
 def help_callback_func(cmd: Command) -> None:
-    console = Console()
-    console.print(command_to_help(cmd))
+    cmd_help = command_to_help(cmd)
+    # stdout can be None (e.g. pythonw) or a replacement stream without isatty
+    isatty = getattr(sys.stdout, "isatty", None)
+    is_terminal = isatty is not None and isatty()
+    if is_terminal or os.environ.get("THERMITE_FORCE_RICH") == "1":
+        console = Console()
+        console.print(cmd_help)
+    elif sys.stdout is not None:
+        # output is piped; no need for the rich layout
+        sys.stdout.write(command_help_to_text(cmd_help))
     sys.exit(0)
 
 
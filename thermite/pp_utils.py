@@ -1,3 +1,4 @@
+import re
 from typing import Callable, Dict, List
 
 from .parameters import Option, ParameterGroup
@@ -28,10 +29,18 @@ def pg_trigger_map(
 
 
 def multi_str_replace(repl_dict: Dict[str, str]) -> Callable[[str], str]:
+    # replacements that leave the string unchanged are never used
+    repl_items = [(old, new) for old, new in repl_dict.items() if old != new]
+    any_old = re.compile("|".join(re.escape(old) for old, _ in repl_items))
+
     def multi_str_replace_inner(x: str) -> str:
-        for old, new in repl_dict.items():
-            if (new_x := x.replace(old, new)) != x:
-                return new_x
+        # one scan to rule out strings without any match
+        if not repl_items or any_old.search(x) is None:
+            return x
+        # only the first replacement (in order of repl_dict) that matches is used
+        for old, new in repl_items:
+            if old in x:
+                return x.replace(old, new)
         return x
 
     return multi_str_replace_inner
@@ -48,10 +57,12 @@ def multi_extend(
             elif isinstance(item, str):
                 return [x, item]
             elif isinstance(item, list):
-                if any([y is None for y in item]):
-                    return [y for y in item if y is not None]
+                # a None in the list means the original trigger is dropped
+                filtered = [y for y in item if y is not None]
+                if len(filtered) != len(item):
+                    return filtered
                 else:
-                    return [x] + [y for y in item if y is not None]
+                    return [x] + filtered
             else:
                 raise Exception("Unexpected return type")
         else:
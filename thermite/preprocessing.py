@@ -1,7 +1,6 @@
 "Basic processing of command line arguments"
 from collections import deque
-from itertools import chain
-from typing import Deque, List, Sequence
+from typing import Deque, Iterable, Iterator, List, Sequence
 
 from more_itertools import split_before
 
@@ -18,6 +17,12 @@ def expand_dash_arg(x: str) -> List[str]:
         return [x]
 
 
+def _expand_dash_args(args: Iterable[str]) -> Iterator[str]:
+    """Lazily apply `expand_dash_arg` to all arguments and flatten the result."""
+    for x in args:
+        yield from expand_dash_arg(x)
+
+
 def split_and_expand(args: Sequence[str]) -> Deque[List[str]]:
     """
     Split command line arguments and expand single dash args.
@@ -36,8 +41,8 @@ def split_and_expand(args: Sequence[str]) -> Deque[List[str]]:
     """
     return deque(
         split_before(
-            chain(*[expand_dash_arg(arg) for arg in args]),
-            pred=lambda x: x.startswith("-"),
+            _expand_dash_args(args),
+            pred=lambda x: x[:1] == "-",
         )
     )
 
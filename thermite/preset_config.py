@@ -1,9 +1,10 @@
-import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 import attrs
 
+_PRESET_KEYS = frozenset({"args", "opts", "cmds"})
+
 
 @attrs.mutable
 class PresetConfig:
@@ -28,11 +29,10 @@ class PresetConfigConverter:
 
     def structure_preset(self, val, obj_type):
         del obj_type
-        if "cmds" in val and val["cmds"] is not None:
-            for key in val["cmds"]:
-                val["cmds"][key] = self.converter.structure(
-                    val["cmds"][key], PresetConfig
-                )
+        cmds = val.get("cmds")
+        if cmds is not None:
+            for key in cmds:
+                cmds[key] = self.converter.structure(cmds[key], PresetConfig)
 
         return PresetConfig(**val)
 
@@ -40,7 +40,7 @@ class PresetConfigConverter:
     def structure_preset_union(self, val, obj_type):
         del obj_type
         if isinstance(val, dict):
-            if set(val.keys()).issubset(set(["args", "opts", "cmds"])):
+            if val.keys() <= _PRESET_KEYS:
                 # likely PresetConfig
                 return self.converter.structure(val, PresetConfig)
             else:
@@ -54,6 +54,8 @@ class PresetConfigConverter:
 
 def read_preset_config(file: Path):
     if file.suffix.lower() in [".json"]:
+        import json
+
         import cattrs.preconf.json as cjson
 
         json_converter = PresetConfigConverter(
@@ -63,7 +65,7 @@ def read_preset_config(file: Path):
             json.loads(file.read_text()), Union[Dict[str, PresetConfig], PresetConfig]
         )
         return preset_conf
-    if file.suffix.lower() in [".yaml", "yml"]:
+    if file.suffix.lower() in [".yaml", ".yml"]:
         import cattrs.preconf.pyyaml as cpyyaml
 
         yaml_converter = PresetConfigConverter(
@@ -72,9 +74,12 @@ def read_preset_config(file: Path):
         try:
             import yaml as pyyaml
 
+            # the C loader is only available if pyyaml was built against libyaml
+            loader = getattr(pyyaml, "CSafeLoader", pyyaml.SafeLoader)
             with file.open("rb") as f:
                 preset_conf = yaml_converter.structure(
-                    pyyaml.safe_load(f), Union[Dict[str, PresetConfig], PresetConfig]
+                    pyyaml.load(f, Loader=loader),
+                    Union[Dict[str, PresetConfig], PresetConfig],
                 )
             return preset_conf
         except ImportError:
@@ -82,7 +87,7 @@ def read_preset_config(file: Path):
         try:
             from ruamel.yaml import YAML
 
-            yaml = YAML(typ="safe")
+            yaml = YAML(typ="safe", pure=False)
 
             with file.open("rb") as f:
                 preset_conf = yaml_converter.structure(
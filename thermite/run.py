@@ -1,9 +1,19 @@
 import contextlib
+import hashlib
+import inspect
 import io
+import os
+import pickle
+import site
 import sys
-from typing import Any, Callable, List, Optional, Union
+import sysconfig
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from attrs import mutable
+from loguru import logger
 
 from thermite.exceptions import RichExcHandler, ThermiteExcHandler
 from thermite.plugins.help import help_callback
@@ -12,6 +22,141 @@ from .command import CliCallback, Command
 from .config import Config
 from .exceptions import CommandError, ParameterError
 
+_DEFAULT_THERMITE_EXC_HANDLER = ThermiteExcHandler(show_tb=False)
+
+
+@lru_cache(maxsize=None)
+def _get_default_rich_exc_handler() -> RichExcHandler:
+    # only created on first use; its defaults need the slow to import rich.traceback
+    return RichExcHandler()
+
+
+def _default_rich_exc_handler(exc: Exception) -> Optional[Exception]:
+    return _get_default_rich_exc_handler()(exc)
+
+
+# number of cached commands kept; the least recently used ones are removed
+_COMMAND_CACHE_MAX_ENTRIES = 64
+
+
+def _command_cache_path(obj: Any, name: str, config: Config) -> Optional[Path]:
+    """
+    Path of the cached command for obj, or None if it can't be cached.
+
+    The key covers the thermite version, the object, the content of the file
+    it is defined in and the config. Changes to other modules are detected
+    when the cached command is loaded (see `_tracked_module_files`).
+    """
+    from thermite import __version__
+
+    try:
+        source_file = inspect.getsourcefile(obj)
+        if source_file is None:
+            return None
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(__version__.encode())
+        hasher.update(f"{obj.__module__}.{obj.__qualname__}:{name}".encode())
+        hasher.update(Path(source_file).read_bytes())
+        hasher.update(pickle.dumps(config))
+    except Exception:
+        # e.g. instances, objects without source or configs holding lambdas
+        return None
+
+    cache_dir = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return cache_dir / "thermite" / f"{hasher.hexdigest()}.pkl"
+
+
+def _tracked_module_files(obj: Any) -> Set[str]:
+    """
+    Files of the loaded modules a cached command for obj is checked against.
+
+    The standard library and installed packages are left out, except for the
+    package obj itself is part of; they only change with a new installation.
+    """
+    obj_pkg = obj.__module__.partition(".")[0]
+    install_dirs = tuple(
+        {sysconfig.get_path("purelib"), sysconfig.get_path("platlib")}
+        | ({site.getusersitepackages()} if site.ENABLE_USER_SITE else set())
+    )
+    files = set()
+    for module_name, module in list(sys.modules.items()):
+        module_file = getattr(module, "__file__", None)
+        if not isinstance(module_file, str):
+            continue
+        top_name = module_name.partition(".")[0]
+        if top_name != obj_pkg and (
+            top_name in sys.stdlib_module_names or module_file.startswith(install_dirs)
+        ):
+            continue
+        files.add(module_file)
+    return files
+
+
+def _module_files_state(files: Iterable[str]) -> Dict[str, Optional[Tuple[int, int]]]:
+    """Modification time and size of module files."""
+    res: Dict[str, Optional[Tuple[int, int]]] = {}
+    for file in files:
+        try:
+            stat = os.stat(file)
+            res[file] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            res[file] = None
+    return res
+
+
+def _prune_command_cache(cache_dir: Path) -> None:
+    """Only keep the most recently used cached commands."""
+    entries = sorted(
+        cache_dir.glob("*.pkl"), key=lambda x: x.stat().st_mtime_ns, reverse=True
+    )
+    for entry in entries[_COMMAND_CACHE_MAX_ENTRIES:]:
+        entry.unlink(missing_ok=True)
+
+
+def _command_from_obj_cached(obj: Any, name: str, config: Config) -> Command:
+    """Create the command, reusing a pickled one from a previous run if possible."""
+    cache_path = _command_cache_path(obj, name, config)
+    if cache_path is None:
+        return Command.from_obj(obj, name=name, config=config)
+
+    try:
+        with cache_path.open("rb") as f:
+            # the module files the command was created with come first, so
+            # a stale command does not even have to be unpickled
+            files_state = pickle.load(f)
+            if _module_files_state(files_state.keys()) == files_state:
+                cmd = pickle.load(f)
+                # the config is used by reference, e.g. when creating subcommands
+                cmd.config = config
+                # mark as recently used
+                os.utime(cache_path)
+                return cmd
+        logger.debug(f"Command cache {cache_path} is outdated")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable command cache {cache_path}: {e}")
+
+    cmd = Command.from_obj(obj, name=name, config=config)
+    try:
+        files_state = _module_files_state(_tracked_module_files(obj))
+        data = pickle.dumps(files_state) + pickle.dumps(cmd)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first so that concurrent runs never
+        # read a partially written cache
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        _prune_command_cache(cache_path.parent)
+    except Exception as e:
+        logger.debug(f"Command for {name} could not be cached: {e}")
+    return cmd
+
 
 def process_all_args(input_args: List[str], cmd: Command) -> Any:
     """
@@ -21,13 +166,15 @@ def process_all_args(input_args: List[str], cmd: Command) -> Any:
     followed up with further processing in subcommands as needed.
     """
     while True:
-        if len(input_args) > 0:
+        if input_args:
             input_args = cmd.process(input_args)
         # CMD_POST_PROCESS Event start
         for cb in cmd.config.event_callbacks:
             cmd = cb.cmd_post_process(cmd)
         # CMD_POST_PROCESS Event end
-        if len(input_args) > 0:
+        if input_args:
+            # no in-place removal; splitters may hand back lists they still use.
+            # the copy is dominated by cmd.process re-splitting the remaining args
             subcmd = cmd.get_subcommand(input_args[0])
             input_args = input_args[1:]
             # CMD_POST_CREATE Event start
@@ -55,12 +202,17 @@ def run(
     exception_handlers: Optional[
         List[Callable[[Exception], Optional[Exception]]]
     ] = None,
-    name: str = sys.argv[0],
-    input_args: List[str] = sys.argv[1:],
+    name: Optional[str] = None,
+    input_args: Optional[List[str]] = None,
     add_thermite_exc_handler: bool = True,
     add_rich_exc_handler: bool = True,
     cli_callbacks_top_level: Optional[List["CliCallback"]] = None,
 ) -> Any:
+    # read sys.argv at call time, not at import time
+    if name is None:
+        name = sys.argv[0]
+    if input_args is None:
+        input_args = sys.argv[1:]
     if config is None:
         config = Config()
     if cli_callbacks_top_level is None:
@@ -69,15 +221,20 @@ def run(
     if add_help_cb:
         config.cli_callbacks.append(help_callback)
 
-    if exception_handlers is None:
-        exception_handlers = []
+    # copy so that the list of the caller is not changed
+    exception_handlers = (
+        list(exception_handlers) if exception_handlers is not None else []
+    )
     if add_thermite_exc_handler:
-        exception_handlers.append(ThermiteExcHandler(show_tb=False))
+        exception_handlers.append(_DEFAULT_THERMITE_EXC_HANDLER)
     if add_rich_exc_handler:
-        exception_handlers.append(RichExcHandler())
+        exception_handlers.append(_default_rich_exc_handler)
 
     try:
-        cmd = Command.from_obj(obj, name=name, config=config)
+        if os.environ.get("THERMITE_CACHE") == "1":
+            cmd = _command_from_obj_cached(obj, name=name, config=config)
+        else:
+            cmd = Command.from_obj(obj, name=name, config=config)
         cmd.local_cli_callbacks = cli_callbacks_top_level
         # CMD_POST_CREATE Event start
         for cb in config.event_callbacks:
@@ -122,19 +279,25 @@ def runner_testing(
     ] = None,
     add_thermite_exc_handler: bool = True,
     add_rich_exc_handler: bool = True,
+    capture_stdout: bool = True,
+    capture_stderr: bool = True,
 ) -> RunOutput:
     if name is None:
         name = obj.__name__
     output = RunOutput(stdout="", stderr="", exit_code=0, exc=None)
+    rout = io.StringIO() if capture_stdout else None
+    rerr = io.StringIO() if capture_stderr else None
     try:
-        with (
-            contextlib.redirect_stdout(io.StringIO()) as rout,
-            contextlib.redirect_stderr(io.StringIO()) as rerr,
-        ):
+        with contextlib.ExitStack() as stack:
+            if rout is not None:
+                stack.enter_context(contextlib.redirect_stdout(rout))
+            if rerr is not None:
+                stack.enter_context(contextlib.redirect_stderr(rerr))
             run(
                 obj=obj,
                 config=config,
                 exception_handlers=exception_handlers,
+                name=name,
                 input_args=input_args,
                 add_thermite_exc_handler=add_thermite_exc_handler,
                 add_rich_exc_handler=add_rich_exc_handler,
@@ -145,6 +308,8 @@ def runner_testing(
     except SystemExit as e:
         output.exit_code = e.code
 
-    output.stdout = rout.getvalue()
-    output.stderr = rerr.getvalue()
+    if rout is not None:
+        output.stdout = rout.getvalue()
+    if rerr is not None:
+        output.stderr = rerr.getvalue()
     return output
@@ -1,13 +1,57 @@
 import inspect
-from collections import defaultdict
+from copy import copy
 from enum import Enum
-from typing import Any, Callable, Dict, Optional, Type
-
-from attrs import field, mutable
-from docstring_parser import Docstring, parse
+from functools import lru_cache, wraps
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    MutableMapping,
+    Optional,
+    Type,
+    TypeVar,
+)
+from weakref import WeakKeyDictionary
+
+from attrs import evolve, field, mutable
 
 from thermite.config import standardize_obj
 
+if TYPE_CHECKING:
+    from docstring_parser import Docstring
+
+T = TypeVar("T")
+
+
+def _cache_by_obj(func: Callable[[Any], T]) -> Callable[[Any], T]:
+    """Cache the results of func; unhashable inputs are passed through uncached."""
+    func_cached = lru_cache(maxsize=1024)(func)
+
+    @wraps(func)
+    def wrapper(obj: Any) -> T:
+        try:
+            hash(obj)
+        except TypeError:
+            return func(obj)
+        return func_cached(obj)
+
+    return wrapper
+
+
+# inspecting objects and parsing docs is the main cost of creating commands;
+# the same objects are inspected repeatedly when walking subcommands
+_signature = _cache_by_obj(inspect.signature)
+_getdoc = _cache_by_obj(inspect.getdoc)
+
+
+@_cache_by_obj
+def _parse_doc(doc: str) -> "Docstring":
+    # docstring_parser is only needed once a docstring has to be parsed
+    from docstring_parser import parse
+
+    return parse(doc)
+
 
 class CliParamKind(Enum):
     OPTION = "OPTION"
@@ -44,14 +88,12 @@ class ObjSignature:
 class Descriptions:
     short_descr: Optional[str] = None
     long_descr: Optional[str] = None
-    args_doc_dict: Dict[str, Optional[str]] = field(
-        factory=lambda: defaultdict(lambda: None)
-    )
+    args_doc_dict: Dict[str, Optional[str]] = field(factory=dict)
 
     def update(self, obj: Any):
-        obj_doc = inspect.getdoc(obj)
+        obj_doc = _getdoc(obj)
         if obj_doc is not None:
-            obj_doc_parsed = parse(obj_doc)
+            obj_doc_parsed = _parse_doc(obj_doc)
             if obj_doc_parsed.long_description is not None:
                 self.long_descr = obj_doc_parsed.long_description
             if obj_doc_parsed.short_description is not None:
@@ -61,10 +103,8 @@ class Descriptions:
             )
 
 
-def doc_to_dict(doc_parsed: Docstring) -> Dict[str, Optional[str]]:
-    res: Dict[str, Optional[str]] = defaultdict(lambda: None)
-    res.update({x.arg_name: x.description for x in doc_parsed.params})
-    return res
+def doc_to_dict(doc_parsed: "Docstring") -> Dict[str, Optional[str]]:
+    return {x.arg_name: x.description for x in doc_parsed.params}
 
 
 def extract_descriptions(obj: Any) -> Descriptions:
@@ -89,7 +129,7 @@ def create_params_sig_dict(
             name=name,
             python_kind=param.kind,
             cli_kind=CliParamKind.OPTION,
-            descr=args_doc_dict[name],
+            descr=args_doc_dict.get(name),
             default_value=param.default,
             annot=param.annotation,
         )
@@ -97,9 +137,47 @@ def create_params_sig_dict(
     return params
 
 
+def _copy_obj_sig(sig: ObjSignature) -> ObjSignature:
+    # callbacks are allowed to change the signature, so never hand out the cached one
+    return evolve(sig, params={name: copy(p) for name, p in sig.params.items()})
+
+
+def _cache_obj_sig(
+    func: Callable[[Any], ObjSignature],
+) -> Callable[[Any], ObjSignature]:
+    """Cache the signature per object; weakly where the object allows for it."""
+    weak_cache: MutableMapping[Any, ObjSignature] = WeakKeyDictionary()
+    strong_cache: Dict[Any, ObjSignature] = {}
+
+    @wraps(func)
+    def wrapper(obj: Any) -> ObjSignature:
+        try:
+            hash(obj)
+        except TypeError:
+            return func(obj)
+        try:
+            cache = weak_cache
+            sig = cache.get(obj)
+        except TypeError:
+            # e.g. builtins can not be weakly referenced
+            cache = strong_cache
+            sig = cache.get(obj)
+        if sig is None:
+            sig = func(obj)
+            cache[obj] = sig
+        return _copy_obj_sig(sig)
+
+    return wrapper
+
+
 def process_function_to_obj_signature(func: Callable) -> ObjSignature:
+    return _function_to_obj_signature(func)
+
+
+@_cache_obj_sig
+def _function_to_obj_signature(func: Callable) -> ObjSignature:
     descriptions = extract_descriptions(func)
-    func_sig = inspect.signature(func)
+    func_sig = _signature(func)
 
     return ObjSignature(
         params=create_params_sig_dict(func_sig.parameters, descriptions.args_doc_dict),
@@ -110,9 +188,14 @@ def process_function_to_obj_signature(func: Callable) -> ObjSignature:
 
 
 def process_class_to_obj_signature(klass: Type) -> ObjSignature:
+    return _class_to_obj_signature(klass)
+
+
+@_cache_obj_sig
+def _class_to_obj_signature(klass: Type) -> ObjSignature:
     descriptions = extract_descriptions(klass)
     if klass.__init__ != object.__init__:
-        init_sig = inspect.signature(klass.__init__)
+        init_sig = _signature(klass.__init__)
         return ObjSignature(
             params=create_params_sig_dict(
                 init_sig.parameters, descriptions.args_doc_dict
@@ -127,11 +210,17 @@ def process_class_to_obj_signature(klass: Type) -> ObjSignature:
 
 
 def process_instance_to_obj_signature(obj: Any) -> ObjSignature:
+    # the signature of an instance only depends on its class
+    return _instance_class_to_obj_signature(obj.__class__)
+
+
+@_cache_obj_sig
+def _instance_class_to_obj_signature(klass: Type) -> ObjSignature:
     # get the documentation
-    klass_doc = inspect.getdoc(obj.__class__)
+    klass_doc = _getdoc(klass)
 
     if klass_doc is not None:
-        klass_doc_parsed = parse(klass_doc)
+        klass_doc_parsed = _parse_doc(klass_doc)
         short_descr = klass_doc_parsed.short_description
         long_descr = klass_doc_parsed.long_description
     else:
@@ -141,7 +230,7 @@ def process_instance_to_obj_signature(obj: Any) -> ObjSignature:
     # as it is an instance, there are no things to call
     return ObjSignature(
         params={},
-        return_annot=obj.__class__,
+        return_annot=klass,
         short_descr=short_descr,
         long_descr=long_descr,
     )
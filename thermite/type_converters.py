@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from bisect import insort
 from enum import Enum
 from functools import partial
+from operator import itemgetter
 from pathlib import Path
 from typing import (
     Any,
@@ -14,7 +16,6 @@ from typing import (
     Tuple,
     Type,
     Union,
-    final,
     get_args,
     get_origin,
 )
@@ -55,15 +56,12 @@ def args_used(num_offered: int, num_req: Union[int, slice]) -> int:
                 f"Required {str(num_req)} but was offered {str(num_offered)}"
             )
     else:
-        # it is a slice
-        num_req_min = min(0, num_req.start) if num_req.start is not None else 0
-        num_req_step: int = 1 if num_req.step is None else num_req.step
-        num_req_max: int = (
-            num_req.stop - num_req_step if num_req.stop is not None else None
-        )
+        # it is a slice; the allowed numbers of args are range(start, stop, step)
+        num_req_min: int = num_req.start or 0
+        num_req_step: int = num_req.step or 1
         if num_req_step < 1:
             raise ValueError(
-                f"Step in slice has to be positive but was {str(slice.step)}"
+                f"Step in slice has to be positive but was {str(num_req.step)}"
             )
 
         if num_offered < num_req_min:
@@ -71,13 +69,12 @@ def args_used(num_offered: int, num_req: Union[int, slice]) -> int:
                 f"Required {num_req_min} but got {num_offered} arguments."
             )
 
-        num_surplus = num_offered - num_req_min
-        num_surplus_used = num_surplus // num_req_step
-
-        num_used = num_req_min + num_surplus_used
-
-        if num_req_max is not None and num_used >= num_req_max:
-            num_used = num_req_max
+        num_used = num_offered - (num_offered - num_req_min) % num_req_step
+        if num_req.stop is not None:
+            num_req_max = (
+                num_req.stop - 1 - (num_req.stop - 1 - num_req_min) % num_req_step
+            )
+            num_used = min(num_used, num_req_max)
 
         return num_used
 
@@ -111,9 +108,30 @@ class CLIArgConverterBase(ABC):
     def _convert(self, args: Sequence[str]) -> Any:
         ...
 
-    @final
+    def _convert_one(self, arg: str) -> Any:
+        """Unchecked conversion for converters that take a single argument."""
+        return self._convert([arg])
+
+    def can_convert(self, args: Sequence[str]) -> bool:
+        """Cheap check if conversion can succeed. False means it will fail."""
+        del args
+        return True
+
     def convert(self, args: Sequence[str]) -> Any:
-        check_correct_nargs(len(args), self.num_req_args)
+        num_req_args = self.num_req_args
+        if type(num_req_args) is int:
+            # constant number of arguments; same checks as check_correct_nargs
+            num_offered = len(args)
+            if num_offered < num_req_args:
+                raise TooFewArgsError(
+                    f"Required {num_req_args} but was offered {num_offered}"
+                )
+            if num_offered > num_req_args:
+                raise TooManyArgsError(
+                    f"Required {num_req_args} but was offered {num_offered}"
+                )
+        else:
+            check_correct_nargs(len(args), num_req_args)
         return self._convert(args)
 
 
@@ -131,9 +149,24 @@ class BasicCLIArgConverter(CLIArgConverterBase):
                 f"supported type {str(self.supported_type)}"
             )
 
+    def can_convert(self, args: Sequence[str]) -> bool:
+        if self.conv_func is int:
+            # accepts everything int accepts; false positives fail in conversion
+            return args[0].strip().lstrip("+-").replace("_", "").isdecimal()
+        return True
+
+    def convert(self, args: Sequence[str]) -> Any:
+        # always exactly one argument; the base class reports wrong counts
+        if len(args) != 1:
+            return super().convert(args)
+        return self.conv_func(args[0])
+
     def _convert(self, args: Sequence[str]) -> Any:
         return self.conv_func(*args)
 
+    def _convert_one(self, arg: str) -> Any:
+        return self.conv_func(arg)
+
     @classmethod
     def factory(
         cls,
@@ -150,15 +183,27 @@ class BasicCLIArgConverter(CLIArgConverterBase):
         )
 
 
+# origins of the typing constructs the converters dispatch on
+_LITERAL_ORIGIN = get_origin(Literal["a", "b"])
+_UNION_ORIGIN = get_origin(Union[int, str])
+_LIST_ORIGIN = get_origin(List[int])
+_TUPLE_ORIGIN = get_origin(Tuple[int, int])
+
+# literal values can be None, so lookups need their own sentinel
+_MISSING = object()
+
 # TODO: Should the next classes have base BasicCLIArgConverter?
 @mutable
 class LiteralCLIArgConverter(CLIArgConverterBase):
     target_type: Type
     _args_mapper: Dict[str, Any] = field(factory=dict, init=False)
+    _args_mapper_get: Callable[[str, Any], Any] = field(
+        init=False, repr=False, eq=False
+    )
 
     def __attrs_post_init__(self) -> None:
         self.num_req_args = 1
-        if not get_origin(self.target_type) == get_origin(Literal["a", "b"]):
+        if not get_origin(self.target_type) == _LITERAL_ORIGIN:
             raise TypeError(f"{str(self.target_type)} is not of type 'Literal'")
         literal_args = get_args(self.target_type)
         self._args_mapper = {str(arg): arg for arg in literal_args}
@@ -168,12 +213,19 @@ class LiteralCLIArgConverter(CLIArgConverterBase):
                 f"Type {str(self.target_type)} has duplicate values "
                 "when converted to string."
             )
+        self._args_mapper_get = self._args_mapper.get
+
+    def can_convert(self, args: Sequence[str]) -> bool:
+        return args[0] in self._args_mapper
 
     def _convert(self, args: Sequence[str]) -> Any:
-        if args[0] in self._args_mapper:
-            return self._args_mapper[args[0]]
-        else:
-            raise ValueError(f"{args[0]} not part of {str(self.target_type)}")
+        return self._convert_one(args[0])
+
+    def _convert_one(self, arg: str) -> Any:
+        res = self._args_mapper_get(arg, _MISSING)
+        if res is _MISSING:
+            raise ValueError(f"{arg} not part of {str(self.target_type)}")
+        return res
 
     @classmethod
     def factory(cls, target_type: Type, store: "CLIArgConverterStore"):
@@ -185,18 +237,28 @@ class LiteralCLIArgConverter(CLIArgConverterBase):
 class EnumCLIArgConverter(CLIArgConverterBase):
     target_type: Type
     _args_mapper: Dict[str, Any] = field(factory=dict, init=False)
+    _args_mapper_get: Callable[[str, Any], Any] = field(
+        init=False, repr=False, eq=False
+    )
 
     def __attrs_post_init__(self) -> None:
         self.num_req_args = 1
         if not issubclass(self.target_type, Enum):
             raise TypeError(f"{str(self.target_type)} is not an Enum")
         self._args_mapper = {e.name: e for e in self.target_type}
+        self._args_mapper_get = self._args_mapper.get
+
+    def can_convert(self, args: Sequence[str]) -> bool:
+        return args[0] in self._args_mapper
 
     def _convert(self, args: Sequence[str]) -> Any:
-        if args[0] in self._args_mapper:
-            return self._args_mapper[args[0]]
-        else:
-            raise ValueError(f"{args[0]} not part of {str(self.target_type)}")
+        return self._convert_one(args[0])
+
+    def _convert_one(self, arg: str) -> Any:
+        res = self._args_mapper_get(arg, _MISSING)
+        if res is _MISSING:
+            raise ValueError(f"{arg} not part of {str(self.target_type)}")
+        return res
 
     @classmethod
     def factory(cls, target_type: Type, store: "CLIArgConverterStore"):
@@ -204,6 +266,12 @@ class EnumCLIArgConverter(CLIArgConverterBase):
         return cls(target_type=target_type)
 
 
+_BOOL_MAP: Dict[str, bool] = {
+    **dict.fromkeys(("true", "t", "yes", "y", "1"), True),
+    **dict.fromkeys(("false", "f", "no", "n", "0"), False),
+}
+
+
 @mutable
 class BoolCLIArgConverter(CLIArgConverterBase):
     target_type: Type
@@ -213,13 +281,17 @@ class BoolCLIArgConverter(CLIArgConverterBase):
         if self.target_type != bool:
             raise TypeError(f"{str(self.target_type)} is not a boolean")
 
+    def can_convert(self, args: Sequence[str]) -> bool:
+        return args[0].lower() in _BOOL_MAP
+
     def _convert(self, args: Sequence[str]) -> Any:
-        if args[0].lower() in ("true", "t", "yes"):
-            return True
-        elif args[0].lower() in ("false", "f", "no"):
-            return False
-        else:
-            raise ValueError(f"Can't convert {args[0]} to boolean")
+        return self._convert_one(args[0])
+
+    def _convert_one(self, arg: str) -> Any:
+        res = _BOOL_MAP.get(arg.lower())
+        if res is None:
+            raise ValueError(f"Can't convert {arg} to boolean")
+        return res
 
     @classmethod
     def factory(cls, target_type: Type, store: "CLIArgConverterStore"):
@@ -231,10 +303,14 @@ class BoolCLIArgConverter(CLIArgConverterBase):
 class UnionCLIArgConverter(CLIArgConverterBase):
     target_type: Type
     _converters: List[CLIArgConverterBase] = field(factory=list)
+    _lookup: Dict[str, Any] = field(init=False, repr=False, eq=False)
+    _fallback_converters: List[CLIArgConverterBase] = field(
+        init=False, repr=False, eq=False
+    )
 
     @classmethod
     def factory(cls, target_type: Type, store: "CLIArgConverterStore"):
-        if not get_origin(target_type) == get_origin(Union[int, str]):
+        if not get_origin(target_type) == _UNION_ORIGIN:
             raise TypeError(f"{str(target_type)} is not of type 'Union'")
 
         converters = store.get_sorted_converters(get_args(target_type))
@@ -251,31 +327,68 @@ class UnionCLIArgConverter(CLIArgConverterBase):
                     " a Union has to be equal"
                 )
 
-    def _convert(self, args: Sequence[str]) -> Any:
+        # leading Literal and Enum members are merged into a single lookup;
+        # earlier members have higher priority and win on duplicate strings
+        self._lookup = {}
+        num_mapped = 0
         for converter in self._converters:
+            if type(converter) not in (LiteralCLIArgConverter, EnumCLIArgConverter):
+                break
+            for key, value in converter._args_mapper.items():  # type: ignore
+                self._lookup.setdefault(key, value)
+            num_mapped += 1
+        self._fallback_converters = self._converters[num_mapped:]
+
+    def _convert(self, args: Sequence[str]) -> Any:
+        if self._lookup:
+            # only set up for single argument members
+            res = self._lookup.get(args[0], _MISSING)
+            if res is not _MISSING:
+                return res
+        # all converters require the same number of args as the union itself
+        for converter in self._fallback_converters:
+            if not converter.can_convert(args):
+                continue
             try:
-                return converter.convert(args)
+                return converter._convert(args)
             except Exception:
                 pass
         raise ValueError(f"No fitting type found in union for {args}")
 
 
+def _single_arg_convert_func(
+    converter: CLIArgConverterBase,
+) -> Optional[Callable[[str], Any]]:
+    """Function converting a single argument without checks, if applicable."""
+    if converter.num_req_args != 1:
+        return None
+    if type(converter) is BasicCLIArgConverter:
+        # skip the method and call the conversion directly
+        return converter.conv_func
+    return converter._convert_one
+
+
 @mutable
 class ListCLIArgConverter(CLIArgConverterBase):
     target_type: Type
     inner_converter: CLIArgConverterBase = field(
         factory=lambda: BasicCLIArgConverter(str, str, str)
     )
+    _group_size: int = field(init=False, repr=False, eq=False)
+    # conversion of a single argument if groups have size 1
+    _convert_one_func: Optional[Callable[[str], Any]] = field(
+        init=False, repr=False, eq=False
+    )
 
     @classmethod
     def factory(cls, target_type: Type, store: "CLIArgConverterStore"):
-        if not get_origin(target_type) == get_origin(List):
+        if not get_origin(target_type) == _LIST_ORIGIN:
             raise TypeError(f"{str(target_type)} is not of type 'List'")
 
         type_args = get_args(target_type)
         if len(type_args) == 0:
             # default is already correct
-            pass
+            return cls(target_type=target_type)
         elif len(type_args) == 1:
             inner_converter = store.get_converter(type_args[0])
         else:
@@ -289,28 +402,47 @@ class ListCLIArgConverter(CLIArgConverterBase):
         if not isinstance(inner_num_args, int):
             raise TypeError("Inner type can't have variable number of args")
         self.num_req_args = slice(0, None, inner_num_args)
+        self._group_size = inner_num_args
+        self._convert_one_func = _single_arg_convert_func(self.inner_converter)
+
+    def convert(self, args: Sequence[str]) -> Any:
+        # any multiple of the group size is allowed, which _convert checks itself
+        return self._convert(args)
 
     def _convert(self, args: Sequence[str]) -> Any:
-        req_group_args = self.num_req_args.step  # type: ignore
+        convert_one = self._convert_one_func
+        if convert_one is not None:
+            if convert_one is str:
+                # the args are strings already
+                return list(args)
+            return [convert_one(arg) for arg in args]
+
+        req_group_args = self._group_size
         num_groups = len(args) // req_group_args
         num_args = num_groups * req_group_args
         if len(args) > num_args:
-            raise TooManyArgsError()
-        out = []
-        for i in range(0, num_args, req_group_args):
-            group_args = args[i : (i + req_group_args)]
-            out.append(self.inner_converter.convert(group_args))
-        return out
+            raise TooManyArgsError(
+                f"Required {str(self.num_req_args)} but was offered {len(args)}"
+            )
+        inner_convert = self.inner_converter._convert
+        return [
+            inner_convert(args[i : (i + req_group_args)])
+            for i in range(0, num_args, req_group_args)
+        ]
 
 
 @mutable
 class TupleCLIArgConverter(CLIArgConverterBase):
     target_type: Type
     tuple_converters: List[CLIArgConverterBase] = field(factory=list)
+    # per converter its slice of the args and, for single-arg ones, the function
+    _plan: List[Tuple[CLIArgConverterBase, int, int, Optional[Callable]]] = field(
+        init=False, repr=False, eq=False
+    )
 
     @classmethod
     def factory(cls, target_type: Type, store: "CLIArgConverterStore"):
-        if not get_origin(target_type) == get_origin(Tuple):
+        if not get_origin(target_type) == _TUPLE_ORIGIN:
             raise TypeError(f"{str(target_type)} is not of type 'Tuple'")
 
         type_args = get_args(target_type)
@@ -322,69 +454,137 @@ class TupleCLIArgConverter(CLIArgConverterBase):
     def __attrs_post_init__(self) -> None:
         # ensure that all of them have finite number of required args
         self.num_req_args = 0
+        self._plan = []
         for converter in self.tuple_converters:
-            if not isinstance(converter.num_req_args, int):
+            num_args = converter.num_req_args
+            if not isinstance(num_args, int):
                 raise CLIArgConverterError(
                     "Each type as part of a tuple has to have "
                     "constant number of arguments."
                 )
-            self.num_req_args += converter.num_req_args
+            start = self.num_req_args
+            self.num_req_args += num_args
+            self._plan.append(
+                (
+                    converter,
+                    start,
+                    self.num_req_args,
+                    _single_arg_convert_func(converter),
+                )
+            )
 
     def _convert(self, args: Sequence[str]) -> Any:
-        tuple_out = []
-        pos = 0
-        for converter in self.tuple_converters:
-            assert isinstance(converter.num_req_args, int)
-            tuple_args = args[pos : (pos + converter.num_req_args)]
-            pos = pos + converter.num_req_args
-            tuple_out.append(converter.convert(tuple_args))
-        return tuple(tuple_out)
+        # the number of args is correct by construction
+        return tuple(
+            [
+                (
+                    conv_func(args[start])
+                    if conv_func is not None
+                    else converter._convert(args[start:stop])
+                )
+                for converter, start, stop, conv_func in self._plan
+            ]
+        )
+
+
+# converter factory, its priority and its dispatch key
+_FactoryEntry = Tuple[
+    Callable[[Type, "CLIArgConverterStore"], CLIArgConverterBase], float, Any
+]
 
 
 class CLIArgConverterStore:
-    _converter_factories: List[
-        Tuple[Callable[[Type, "CLIArgConverterStore"], CLIArgConverterBase], float]
-    ]
+    """
+    Store of converter factories, tried in order of priority.
+
+    Converters are cached by target type and shared between all users,
+    so they must not hold any state that changes after construction.
+
+    Factories can be registered with a dispatch key, the type or type origin
+    they exclusively handle; Enum as key covers all its subclasses. For a
+    target type only the factories for its key and the ones without a key
+    are tried.
+    """
+
+    _converter_factories: List[_FactoryEntry]
+    _converter_cache: Dict[Any, Tuple[CLIArgConverterBase, float]]
+    _dispatch_cache: Dict[Any, List[_FactoryEntry]]
 
     def __init__(self, add_defaults: bool = True):
         self._converter_factories = []
+        self._converter_cache = {}
+        self._dispatch_cache = {}
         if add_defaults:
             self.add_default_converters()
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # the caches are rebuilt on demand and would only make the state unstable
+        state = self.__dict__.copy()
+        state["_converter_cache"] = {}
+        state["_dispatch_cache"] = {}
+        return state
+
     def add_converter_factory(
         self,
         converter_factory: Callable[
             [Type, "CLIArgConverterStore"], CLIArgConverterBase
         ],
         priority: float,
+        dispatch_key: Any = None,
     ):
-        self._converter_factories.append((converter_factory, priority))
-        self._converter_factories.sort(key=lambda x: x[1], reverse=True)
+        # kept sorted by descending priority; equal priorities in insertion order
+        insort(
+            self._converter_factories,
+            (converter_factory, priority, dispatch_key),
+            key=lambda x: -x[1],
+        )
+        self._converter_cache.clear()
+        self._dispatch_cache.clear()
 
     def add_default_converters(self):
         self.add_converter_factory(
-            partial(BasicCLIArgConverter.factory, supported_type=str), 1
+            partial(BasicCLIArgConverter.factory, supported_type=str), 1, str
         )
         self.add_converter_factory(
-            partial(BasicCLIArgConverter.factory, supported_type=Path), 2
+            partial(BasicCLIArgConverter.factory, supported_type=Path), 2, Path
         )
-        self.add_converter_factory(BoolCLIArgConverter.factory, 3)
+        self.add_converter_factory(BoolCLIArgConverter.factory, 3, bool)
         self.add_converter_factory(
-            partial(BasicCLIArgConverter.factory, supported_type=float), 4
+            partial(BasicCLIArgConverter.factory, supported_type=float), 4, float
         )
         self.add_converter_factory(
-            partial(BasicCLIArgConverter.factory, supported_type=int), 5
+            partial(BasicCLIArgConverter.factory, supported_type=int), 5, int
         )
-        self.add_converter_factory(EnumCLIArgConverter.factory, 6)
-        self.add_converter_factory(LiteralCLIArgConverter.factory, 7)
-        self.add_converter_factory(UnionCLIArgConverter.factory, 8)
-        self.add_converter_factory(ListCLIArgConverter.factory, 9)
-        self.add_converter_factory(TupleCLIArgConverter.factory, 10)
+        self.add_converter_factory(EnumCLIArgConverter.factory, 6, Enum)
+        self.add_converter_factory(LiteralCLIArgConverter.factory, 7, Literal)
+        self.add_converter_factory(UnionCLIArgConverter.factory, 8, Union)
+        self.add_converter_factory(ListCLIArgConverter.factory, 9, list)
+        self.add_converter_factory(TupleCLIArgConverter.factory, 10, tuple)
+
+    def _candidate_factories(self, target_type: Type) -> List[_FactoryEntry]:
+        key = get_origin(target_type) or target_type
+        try:
+            return self._dispatch_cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable type annotations have to try all factories
+            return self._converter_factories
 
-    def get_converter_with_priority(
+        if isinstance(key, type) and issubclass(key, Enum):
+            keys: Tuple[Any, ...] = (key, Enum)
+        else:
+            keys = (key,)
+        candidates = [
+            x for x in self._converter_factories if x[2] is None or x[2] in keys
+        ]
+        self._dispatch_cache[key] = candidates
+        return candidates
+
+    def _find_converter_with_priority(
         self, target_type: Type
     ) -> Tuple[CLIArgConverterBase, float]:
-        for converter_factory, priority in self._converter_factories:
+        for converter_factory, priority, _ in self._candidate_factories(target_type):
             try:
                 converter = converter_factory(target_type, self)
                 return (converter, priority)
@@ -393,6 +593,21 @@ class CLIArgConverterStore:
 
         raise TypeError(f"No available converter for {str(target_type)}")
 
+    def get_converter_with_priority(
+        self, target_type: Type
+    ) -> Tuple[CLIArgConverterBase, float]:
+        try:
+            return self._converter_cache[target_type]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable type annotations are not cached
+            return self._find_converter_with_priority(target_type)
+
+        res = self._find_converter_with_priority(target_type)
+        self._converter_cache[target_type] = res
+        return res
+
     def get_converter(self, target_type: Type) -> CLIArgConverterBase:
         return self.get_converter_with_priority(target_type)[0]
 
@@ -403,5 +618,5 @@ class CLIArgConverterStore:
             self.get_converter_with_priority(target_type)
             for target_type in target_types
         ]
-        converters_list.sort(key=lambda x: x[1], reverse=True)
+        converters_list.sort(key=itemgetter(1), reverse=True)
         return [x[0] for x in converters_list]
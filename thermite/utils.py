@@ -1,14 +1,18 @@
 """Utilities for the package."""
 
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, Type
 
 
+# the same names are converted repeatedly, e.g. when rendering help
+@lru_cache(maxsize=1024)
 def clify_argname(x: str) -> str:
     return x.replace("_", "-")
 
 
-class ClassContentType(Enum):
+class ClassContentType(str, Enum):
+    # str mixin so comparisons and hashing use the plain string implementation
     classmethod = "classmethod"
     instancemethod = "instancemethod"
     staticmethod = "staticmethod"
@@ -18,22 +22,21 @@ class ClassContentType(Enum):
 
 
 def analyze_class(klass: Type, omit_dunder: bool = True) -> Dict[str, ClassContentType]:
-    attr_list = [attr for attr in dir(klass)]
-    if omit_dunder:
-        attr_list = list(filter(lambda x: not x.startswith("__"), attr_list))
-
-    res = {}
-    for attr_name in attr_list:
-        attr = klass.__dict__[attr_name]
-        if isinstance(attr, staticmethod):
-            res[attr_name] = ClassContentType.staticmethod
-        elif isinstance(attr, classmethod):
-            res[attr_name] = ClassContentType.classmethod
-        elif isinstance(attr, property):
-            res[attr_name] = ClassContentType.property
-        else:
-            if callable(attr):
-                res[attr_name] = ClassContentType.instancemethod
+    # walk the mro directly; the first class defining a name wins, as for getattr
+    res: Dict[str, ClassContentType] = {}
+    for cls in klass.__mro__:
+        for attr_name, attr in vars(cls).items():
+            if attr_name in res or (omit_dunder and attr_name.startswith("__")):
+                continue
+            if isinstance(attr, staticmethod):
+                res[attr_name] = ClassContentType.staticmethod
+            elif isinstance(attr, classmethod):
+                res[attr_name] = ClassContentType.classmethod
+            elif isinstance(attr, property):
+                res[attr_name] = ClassContentType.property
             else:
-                res[attr_name] = ClassContentType.classvar
+                if callable(attr):
+                    res[attr_name] = ClassContentType.instancemethod
+                else:
+                    res[attr_name] = ClassContentType.classvar
     return res